@@ -14,8 +14,28 @@ You'll edit this file in Task 2.
 """
 import csv
 import json
+from operator import itemgetter
 
-from models import NearEarthObject, CloseApproach
+try:
+    import pandas as pd
+except ImportError:
+    # pandas is optional - the loaders fall back to the standard library.
+    pd = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - the JSON loader falls back to the stdlib module.
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional - without it the CAD file is decoded in one piece.
+    ijson = None
+
+from helpers import cd_to_datetime
+from models import NearEarthObject, CloseApproach, _NAN
 
 
 def load_neos(neo_csv_path):
@@ -24,49 +44,165 @@ def load_neos(neo_csv_path):
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
     :return: A collection of `NearEarthObject`s.
     """
-    # Load NEO data from the given CSV file.
+    # When pandas is available, parse and coerce the columns in C instead of
+    # doing per-row Python-level casts through csv.DictReader.
+    if pd is not None:
+        df = pd.read_csv(
+            neo_csv_path,
+            usecols=["pdes", "name", "diameter", "pha"],
+            dtype={
+                "pdes": "string",
+                "name": "string",
+                "diameter": "float64",
+                "pha": "string",
+            },
+        )
+        designations = df["pdes"].to_numpy()
+        # na_value=None (with an object dtype, so the array can hold it)
+        # yields real None for missing names; .where(..., None) would keep the
+        # nullable string dtype and leak pd.NA into NearEarthObject.name.
+        names = df["name"].to_numpy(dtype=object, na_value=None)
+        diameters = df["diameter"].to_numpy()
+        hazardous = df["pha"].eq("Y").fillna(False).to_numpy()
+        neos = [None] * len(df)
+        for k, (des, name, diameter, pha) in enumerate(
+            zip(designations, names, diameters, hazardous)
+        ):
+            neos[k] = NearEarthObject(
+                designation=des,
+                name=name,
+                diameter=diameter,
+                hazardous=bool(pha),
+            )
+        return neos
+
+    # One cheap buffered pass to count data rows, so the output list can be
+    # presized instead of repeatedly reallocated as it grows.
     with open(neo_csv_path, "r") as f:
-        reader = csv.DictReader(f)
-        neos = []
-        for n in reader:
-            n["name"] = n["name"] or None
-            n["diameter"] = float(n["diameter"]) if n["diameter"] else None
-            n["pha"] = False if n["pha"] in ["", "N"] else True
-            try:
-                neo = NearEarthObject(
-                    designation=n["pdes"],
-                    name=n["name"],
-                    diameter=n["diameter"],
-                    hazardous=n["pha"],
-                )
-            except Exception as e:
-                print(e)
-            else:
-                neos.append(neo)
+        n_rows = sum(1 for _ in f) - 1
+
+    # Load NEO data from the given CSV file, resolving the needed column
+    # indices once from the header and subscripting rows positionally rather
+    # than paying for the dict csv.DictReader builds per row.
+    with open(neo_csv_path, "r") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        pdes_i, name_i, diam_i, pha_i = (
+            header.index(k) for k in ("pdes", "name", "diameter", "pha")
+        )
+        neos = [None] * n_rows
+        k = 0
+        for row in reader:
+            neos[k] = NearEarthObject(
+                designation=row[pdes_i],
+                name=row[name_i] or None,
+                diameter=float(row[diam_i]) if row[diam_i] else _NAN,
+                hazardous=row[pha_i] not in ("", "N"),
+            )
+            k += 1
+        # Quoted multi-line fields make the line count an overestimate of the
+        # record count; drop any unused tail.
+        del neos[k:]
     return neos
 
 
-def load_approaches(cad_json_path):
-    """Read close approach data from a JSON file.
+def _stream_approaches(cad_json_path):
+    """Stream close approach data from a JSON file using ijson.
+
+    Rows are parsed and converted one at a time, so peak memory stays at one
+    row plus the final list instead of the whole decoded ~30 MB file.
 
     :param cad_json_path: A path to a JSON file containing data about close approaches.
     :return: A collection of `CloseApproach`es.
     """
-    # Load close approach data from the given JSON file.
-    with open(cad_json_path, "r") as f:
-        reader = json.load(f)
-        reader = [dict(zip(reader["fields"], data)) for data in reader["data"]]
+    with open(cad_json_path, "rb") as f:
+        fields = next(ijson.items(f, "fields"))
+        des_i, cd_i, dist_i, v_i = (
+            fields.index(k) for k in ("des", "cd", "dist", "v_rel")
+        )
+        # Rewind and stream the data array; the fields prefix is re-read, but
+        # it's a few hundred bytes.
+        f.seek(0)
         approaches = []
-        for line in reader:
-            try:
-                approach = CloseApproach(
-                    designation=line["des"],
-                    time=line["cd"],
-                    distance=float(line["dist"]),
-                    velocity=float(line["v_rel"]),
+        dt_cache = {}
+        for row in ijson.items(f, "data.item"):
+            cd = row[cd_i]
+            time = dt_cache.get(cd)
+            if time is None:
+                time = cd_to_datetime(cd)
+                dt_cache[cd] = time
+            approaches.append(
+                CloseApproach(
+                    designation=row[des_i],
+                    time=time,
+                    distance=float(row[dist_i]),
+                    velocity=float(row[v_i]),
                 )
-            except Exception as e:
-                print(e)
-            else:
-                approaches.append(approach) 
+            )
+    return approaches
+
+
+def load_approaches(cad_json_path):
+    """Read close approach data from a JSON file.
+
+    :param cad_json_path: A path to a JSON file containing data about close approaches.
+    :return: A collection of `CloseApproach`es.
+    """
+    # When ijson is available, stream the data array to avoid materializing
+    # the whole decoded file before any CloseApproach is built.
+    if ijson is not None:
+        return _stream_approaches(cad_json_path)
+
+    # Load close approach data from the given JSON file. orjson parses the
+    # ~30 MB CAD file 2-3x faster than the stdlib json module.
+    with open(cad_json_path, "rb") as f:
+        if orjson is not None:
+            reader = orjson.loads(f.read())
+        else:
+            reader = json.load(f)
+        # Index the raw positional rows directly rather than materializing one
+        # dict per record just to look up four keys.
+        fields = reader["fields"]
+        des_i, cd_i, dist_i, v_i = (
+            fields.index(k) for k in ("des", "cd", "dist", "v_rel")
+        )
+        data_rows = reader["data"]
+        if not data_rows:
+            return []
+        # Pull all four needed columns in one C-level itemgetter call per row,
+        # transposed into per-column tuples.
+        get_fields = itemgetter(des_i, cd_i, dist_i, v_i)
+        designations, cd_strs, dist_strs, v_strs = zip(*map(get_fields, data_rows))
+        # Parse all approach times up front: one vectorized C-level parse via
+        # pandas when available, otherwise parse each unique `cd` string once
+        # and reuse the resulting datetime.
+        if pd is not None:
+            times = pd.to_datetime(
+                cd_strs, format="%Y-%b-%d %H:%M", cache=True
+            ).to_pydatetime()
+        else:
+            dt_cache = {}
+            times = []
+            for cd in cd_strs:
+                time = dt_cache.get(cd)
+                if time is None:
+                    time = cd_to_datetime(cd)
+                    dt_cache[cd] = time
+                times.append(time)
+        # Coerce the distance and velocity columns in bulk rather than with
+        # two float() calls per loop iteration. Deliberately float(), not
+        # pd.to_numeric: pandas' fast parser isn't correctly rounded, and the
+        # loaded values must not differ by ULPs based on what's installed.
+        distances = [float(x) for x in dist_strs]
+        velocities = [float(x) for x in v_strs]
+        # The row count is known here, so presize the output list and assign
+        # by index rather than growing it by appends.
+        approaches = [None] * len(designations)
+        for k, des in enumerate(designations):
+            approaches[k] = CloseApproach(
+                designation=des,
+                time=times[k],
+                distance=distances[k],
+                velocity=velocities[k],
+            )
     return approaches
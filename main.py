@@ -38,6 +38,7 @@ If needed, the script can load data from data files other than the default with
 """
 import argparse
 import cmd
+import concurrent.futures
 import datetime
 import pathlib
 import shlex
@@ -381,8 +382,13 @@ def main():
     parser, inspect_parser, query_parser = make_parser()
     args = parser.parse_args()
 
-    # Extract data from the data files into structured Python objects.
-    database = NEODatabase(load_neos(args.neofile), load_approaches(args.cadfile))
+    # Extract data from the data files into structured Python objects. The two
+    # loads are independent, so run them on separate threads to overlap the
+    # CSV parse with the (larger) JSON parse.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        neos_future = executor.submit(load_neos, args.neofile)
+        approaches_future = executor.submit(load_approaches, args.cadfile)
+        database = NEODatabase(neos_future.result(), approaches_future.result())
 
     # Run the chosen subcommand.
     if args.cmd == 'inspect':
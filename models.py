@@ -18,7 +18,13 @@ quirks of the data set, such as missing names and unknown diameters.
 You'll edit this file in Task 1.
 """
 from helpers import cd_to_datetime, datetime_to_str
+import datetime
 import math
+import sys
+
+# Shared not-a-number sentinel for unknown values - hoisted to module scope so
+# each construction doesn't re-parse the string via float("nan").
+_NAN = float("nan")
 
 
 class NearEarthObject:
@@ -34,17 +40,33 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
-    def __init__(self, **info):
+    # Fixed attribute layout - avoids a per-instance __dict__ for the ~30k
+    # NEOs loaded from the NASA data.
+    __slots__ = ("designation", "name", "diameter", "hazardous", "approaches",
+                 "_fullname")
+
+    def __init__(self, designation, name=None, diameter=_NAN, hazardous=False):
         """Create a new `NearEarthObject`.
 
-        :param info: A dictionary of excess keyword arguments supplied to the constructor.
+        :param designation: The primary designation of this NEO.
+        :param name: The IAU name of this NEO, if it has one.
+        :param diameter: The diameter of this NEO in kilometers, or NaN if unknown.
+        :param hazardous: Whether this NEO is potentially hazardous.
         """
-        self.designation = info.get("designation")
-        self.name = info.get("name")
-        self.diameter = info.get("diameter")
-        if not self.diameter:
-            self.diameter = float("nan")
-        self.hazardous = info.get("hazardous")
+        # Intern the designation: it's the join key in NEODatabase, and
+        # interning makes the later dict lookups pointer comparisons.
+        self.designation = sys.intern(designation)
+        self.name = name
+        # Callers pass NaN for an unknown diameter (the default), so no
+        # missing-value check is needed here.
+        self.diameter = diameter
+        self.hazardous = hazardous
+        # Designation and name are fixed after load, so format the full name
+        # once here rather than on every str/repr.
+        if not self.name:
+            self._fullname = self.designation
+        else:
+            self._fullname = f"{self.designation} ({self.name})"
 
         # an empty initial collection of linked approaches.
         self.approaches = []
@@ -52,9 +74,7 @@ class NearEarthObject:
     @property
     def fullname(self):
         """Return a representation of the full name of this NEO."""
-        if not self.name:
-            return f"{self.designation}"
-        return f"{self.designation} ({self.name})"
+        return self._fullname
 
     def __str__(self):
         """Return `str(self)`."""
@@ -91,6 +111,39 @@ class NearEarthObject:
         return neo_dict
 
 
+def serialize_neos(neos):
+    """Serialize a sequence of `NearEarthObject`s to a dict of column lists.
+
+    For bulk writes, building each column in a single comprehension is much
+    cheaper than constructing one dict per object via `serialize`. The keys
+    match those of `NearEarthObject.serialize`.
+
+    :param neos: A sequence of `NearEarthObject`s.
+    :return: A dict mapping field names to lists of values, one per NEO.
+    """
+    return {
+        'designation': [neo.designation for neo in neos],
+        'name': [neo.name or "" for neo in neos],
+        'diameter_km': [neo.diameter for neo in neos],
+        'potentially_hazardous': [neo.hazardous for neo in neos],
+    }
+
+
+def serialize_approaches(approaches):
+    """Serialize a sequence of `CloseApproach`es to a dict of column lists.
+
+    The columnar counterpart of `CloseApproach.serialize`, with the same keys.
+
+    :param approaches: A sequence of `CloseApproach`es.
+    :return: A dict mapping field names to lists of values, one per approach.
+    """
+    return {
+        'datetime_utc': [approach.time_str for approach in approaches],
+        'distance_au': [approach.distance for approach in approaches],
+        'velocity_km_s': [approach.velocity for approach in approaches],
+    }
+
+
 class CloseApproach:
     """A close approach to Earth by an NEO.
 
@@ -105,18 +158,35 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
-    def __init__(self, **info):
+    # Fixed attribute layout - avoids a per-instance __dict__ for the ~400k
+    # close approaches loaded from the NASA data.
+    __slots__ = ("_designation", "time", "distance", "velocity", "neo", "_time_str")
+
+    def __init__(self, designation, time, distance=_NAN, velocity=_NAN, neo=None):
         """Create a new `CloseApproach`.
 
-        :param info: A dictionary of excess keyword arguments supplied to the constructor.
+        :param designation: The primary designation of the NEO making this approach.
+        :param time: The date and time of closest approach, either as a NASA
+            `cd`-formatted string or as an already-parsed naive `datetime`.
+        :param distance: The nominal approach distance in astronomical units.
+        :param velocity: The relative approach velocity in kilometers per second.
+        :param neo: The referenced `NearEarthObject`, originally None.
         """
-        self._designation = info.get("designation")
-        self.time = cd_to_datetime(info.get("time"))
-        self.distance = info.get("distance", float("nan"))
-        self.velocity = info.get("velocity", float("nan"))
+        # Interned to match NearEarthObject.designation - the ~400k approach
+        # rows repeat a much smaller set of designations, so this also stores
+        # each unique string once.
+        self._designation = sys.intern(designation)
+        # Accept a pre-parsed datetime so callers can cache the parse of
+        # repeated `cd` strings instead of re-parsing per approach.
+        if not isinstance(time, datetime.datetime):
+            time = cd_to_datetime(time)
+        self.time = time
+        self._time_str = None
+        self.distance = distance
+        self.velocity = velocity
 
         # Create an attribute for the referenced NEO, originally None.
-        self.neo = info.get("neo")
+        self.neo = neo
 
     @property
     def time_str(self):
@@ -131,9 +201,13 @@ class CloseApproach:
         formatted string that can be used in human-readable representations and
         in serialization to CSV and JSON files.
         """
-        # formatted representation of the approach time.
-        # a fullname for this object.
-        return datetime_to_str(self.time)
+        # The approach time never changes after load, so format it at most
+        # once - __str__, __repr__, and serialize all reuse the cached string.
+        s = self._time_str
+        if s is None:
+            s = datetime_to_str(self.time)
+            self._time_str = s
+        return s
 
     def __str__(self):
         """Return `str(self)`."""
@@ -15,7 +15,9 @@ import datetime
 import pathlib
 import math
 import unittest
+import unittest.mock
 
+import extract
 from extract import load_neos, load_approaches
 from models import NearEarthObject, CloseApproach
 
@@ -78,6 +80,41 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertEqual(neo.hazardous, True)
 
 
+@unittest.skipIf(extract.pd is None, 'pandas is not installed')
+class TestLoadNEOsPandasPath(unittest.TestCase):
+    """Exercise the pandas fast path of `load_neos` directly.
+
+    `load_neos` prefers pandas when it's importable, so in an environment
+    without pandas the rest of this module only covers the stdlib fallback.
+    These tests run the preferred path and check that it produces the same
+    objects as the fallback.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.neos = load_neos(TEST_NEO_FILE)
+        with unittest.mock.patch.object(extract, 'pd', None):
+            cls.fallback_neos = load_neos(TEST_NEO_FILE)
+
+    def test_names_are_none_or_str(self):
+        for neo in self.neos:
+            self.assertTrue(
+                neo.name is None or isinstance(neo.name, str),
+                f"Unexpected name {neo.name!r} for {neo.designation}",
+            )
+
+    def test_matches_stdlib_fallback(self):
+        self.assertEqual(len(self.neos), len(self.fallback_neos))
+        for neo, fallback in zip(self.neos, self.fallback_neos):
+            self.assertEqual(neo.designation, fallback.designation)
+            self.assertEqual(neo.name, fallback.name)
+            self.assertEqual(neo.hazardous, fallback.hazardous)
+            if math.isnan(fallback.diameter):
+                self.assertTrue(math.isnan(neo.diameter))
+            else:
+                self.assertEqual(neo.diameter, fallback.diameter)
+
+
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -13,6 +13,8 @@ You'll edit this file in Part 4.
 import csv
 import json
 
+from models import serialize_neos, serialize_approaches
+
 
 def write_to_csv(results, filename):
     """Write an iterable of `CloseApproach` objects to a CSV file.
@@ -29,17 +31,25 @@ def write_to_csv(results, filename):
         'designation', 'name', 'diameter_km', 'potentially_hazardous'
     )
 
-    final = []
-    for i in results:
-        i_dict = i.serialize()
-        i_dict.update(i.neo.serialize())
-        final.append(i_dict)
+    # Serialize column-by-column, then zip the columns back into rows in
+    # fieldname order - no per-approach dicts.
+    results = list(results)
+    approach_cols = serialize_approaches(results)
+    neo_cols = serialize_neos([i.neo for i in results])
+    rows = zip(
+        approach_cols['datetime_utc'],
+        approach_cols['distance_au'],
+        approach_cols['velocity_km_s'],
+        neo_cols['designation'],
+        neo_cols['name'],
+        neo_cols['diameter_km'],
+        neo_cols['potentially_hazardous'],
+    )
 
     with open(filename, 'w') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for i in final:
-            writer.writerow(i)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
 
 def write_to_json(results, filename):
@@ -53,11 +63,33 @@ def write_to_json(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    final = []
-    for i in results:
-        i_dict = i.serialize()
-        i_dict['neo'] = i.neo.serialize()
-        final.append(i_dict)
+    # Serialize column-by-column, then assemble the output dicts (the JSON
+    # format requires one object per approach) in a single comprehension.
+    results = list(results)
+    approach_cols = serialize_approaches(results)
+    neo_cols = serialize_neos([i.neo for i in results])
+    final = [
+        {
+            'datetime_utc': dt,
+            'distance_au': dist,
+            'velocity_km_s': vel,
+            'neo': {
+                'designation': des,
+                'name': name,
+                'diameter_km': diameter,
+                'potentially_hazardous': hazardous,
+            },
+        }
+        for dt, dist, vel, des, name, diameter, hazardous in zip(
+            approach_cols['datetime_utc'],
+            approach_cols['distance_au'],
+            approach_cols['velocity_km_s'],
+            neo_cols['designation'],
+            neo_cols['name'],
+            neo_cols['diameter_km'],
+            neo_cols['potentially_hazardous'],
+        )
+    ]
 
     with open(filename, 'w') as f:
         json.dump(final, f)